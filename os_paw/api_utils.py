@@ -1,4 +1,5 @@
 from enum import Enum
+from functools import partial
 
 from geojson import Feature, LineString
 
@@ -11,10 +12,35 @@ class API_Service(Enum):
     vts = 3
     zxy = 4
 
-VALID_SPATIAL_REFERENCE_SYSTEMS = ('EPSG:4326',
-                                   'EPSG:27700')
-VALID_OUTPUT_FORMATS = ('geojson')
-                        # no longer valid 'xml')
+_API_SERVICE_NAMES = frozenset(API_Service.__members__)
+_API_SERVICE_ERROR = f'Please use {[api.name for api in API_Service]}'
+
+VALID_SPATIAL_REFERENCE_SYSTEMS = frozenset({'EPSG:4326',
+                                             'EPSG:27700'})
+VALID_OUTPUT_FORMATS = frozenset({'geojson'})
+                                  # no longer valid 'xml'
+
+
+# Product catalogues per API service. Only wfs is catalogued so far; add
+# the other services here as their products are added to os_paw.products.
+_PRODUCT_DICTS = {API_Service.wfs.name: products.wfs_products}
+
+
+def _build_product_cache():
+    product_cache = {}
+    for api_service, product_dict in _PRODUCT_DICTS.items():
+        open_products = frozenset(product_dict['Open'])
+        premium_products = frozenset(product_dict['Premium'])
+        all_products = open_products | premium_products
+        product_cache[api_service] = {'open': open_products,
+                                      'premium': premium_products,
+                                      'all': all_products,
+                                      'lowered': tuple(
+                                          (product, product.lower())
+                                          for product in all_products)}
+    return product_cache
+
+_PRODUCT_CACHE = _build_product_cache()
 
 
 def get_feature_geometry_type(feature):
@@ -25,8 +51,10 @@ def get_feature_geometry_type(feature):
         raise Exception('Feature is not in standard GeoJSON format.')
 
 
-def convert_features_to_geojson(features):
-    return [convert_single_feature_to_geojson(feat) for feat in features]
+def convert_features_to_geojson(features, geometry_type=LineString):
+    return [Feature(geometry=geometry_type(feat['geometry']['coordinates'][0]),
+                    properties=feat['properties'])
+            for feat in features]
 
 
 def convert_single_feature_to_geojson(single_feature: Feature, 
@@ -39,49 +67,48 @@ def convert_single_feature_to_geojson(single_feature: Feature,
 
 
 def validate_api_service(api_service):
-    if not hasattr(API_Service, api_service): 
-        raise TypeError(f'Please use {[api.name for api in API_Service]}')
+    if api_service not in _API_SERVICE_NAMES:
+        raise TypeError(_API_SERVICE_ERROR)
 
 
 def validate_srs(srs_string):
-    assert srs_string in VALID_SPATIAL_REFERENCE_SYSTEMS, (f'{srs_string} is '
-                                    'not a valid Spatial Reference System.\n'
-                                    'Valid Spatial Reference Systems are: '
-                                    f'{VALID_SPATIAL_REFERENCE_SYSTEMS}.')
+    if srs_string not in VALID_SPATIAL_REFERENCE_SYSTEMS:
+        raise ValueError(f'{srs_string} is '
+                         'not a valid Spatial Reference System.\n'
+                         'Valid Spatial Reference Systems are: '
+                         f'{sorted(VALID_SPATIAL_REFERENCE_SYSTEMS)}.')
 
 
 def validate_output_format(output_format_string):
-    assert output_format_string.lower() in VALID_OUTPUT_FORMATS, (''
-                                                f'{output_format_string} is '
-                                                'not a valid output format. \n'
-                                                'Valid output formats are: '
-                                                f'{VALID_OUTPUT_FORMATS}.')
+    if output_format_string in VALID_OUTPUT_FORMATS:
+        return
+    if output_format_string.lower() not in VALID_OUTPUT_FORMATS:
+        raise ValueError(f'{output_format_string} is '
+                         'not a valid output format. \n'
+                         'Valid output formats are: '
+                         f'{sorted(VALID_OUTPUT_FORMATS)}.')
 
 
 def validate_type_name(type_name, api_service, allow_premium=False):
     api_service = api_service.lower()
     validate_api_service(api_service)
-    product_dict = getattr(products, f'{api_service}_products')
-    open_products = product_dict['Open']
-    premium_products = product_dict['Premium']
-    all_products = open_products | premium_products
-    suggestions = find_most_similar_products(type_name, all_products)
-    if not allow_premium:
-        if type_name not in open_products and type_name in premium_products:
-            raise ValueError((f'"{type_name}" is only available as a '
-                        f'Premium Product. \n\n Best matches: {suggestions}'))
-        elif type_name not in all_products:
-            raise ValueError((f'"{type_name}" is not a valid Product. \n\n'
-                f'Available Products: \n{all_products}\n\n'
-                f'Best matches: {suggestions}'))
-        else:
-            return type_name in open_products
-    elif allow_premium:
-        if type_name not in all_products:
-            raise ValueError((f'"{type_name}" is not a valid Product. \n\n'
-                f'Available Products: \n{all_products}\n\n'
-                f'Best matches: {suggestions}'))
-    return True
+    try:
+        product_cache = _PRODUCT_CACHE[api_service]
+    except KeyError:
+        raise ValueError(f'No products are available for "{api_service}".')
+    if type_name in product_cache['open']:
+        return True
+    lowered_products = product_cache['lowered']
+    if type_name in product_cache['premium']:
+        if allow_premium:
+            return True
+        raise ValueError((f'"{type_name}" is only available as a '
+                    f'Premium Product. \n\n Best matches: '
+                    f'{_find_similar_in_cache(type_name, lowered_products)}'))
+    raise ValueError((f'"{type_name}" is not a valid Product. \n\n'
+        f'Available Products: \n{set(product_cache["all"])}\n\n'
+        f'Best matches: '
+        f'{_find_similar_in_cache(type_name, lowered_products)}'))
 
 
 def find_most_similar_products(type_name, all_products):
@@ -89,45 +116,61 @@ def find_most_similar_products(type_name, all_products):
             if type_name.lower() in product.lower()]
 
 
-def _validate_bbox(bbox_string, srs, min_x, max_x, min_y, max_y):
+def _find_similar_in_cache(type_name, lowered_products):
+    """lowered_products is an iterable of (product, product.lower()) pairs,
+    as stored in _PRODUCT_CACHE."""
+    needle = type_name.lower()
+    return [product for product, lowered_product in lowered_products
+            if needle in lowered_product]
+
+
+def _validate_bbox(bbox_string, min_x, max_x, min_y, max_y, msg):
     bbox_list = bbox_string.split(',')
-    if srs == 'EPSG:4326':
-        msg = ('Format bbox as a comma-separated string of the form '
-                '"latitude_SW, longitude_SW, latitude_NE, longitude_NE".')
-    elif srs == 'EPSG:27700':
-        msg = ('Format bbox as a comma-separated string of the form '
-               '"Easting_SW, Northing_SW, Easting_NE, Northing_NE".')
-    assert (float(bbox_list[0]) > min_y and float(bbox_list[0]) < max_y) and \
-           (float(bbox_list[2]) > min_y and float(bbox_list[2]) < max_y), (''
-                                f'British Latitude values must be between '
-                                f'{min_y} and {max_y}. {msg}')
-    assert (float(bbox_list[1]) > min_x and float(bbox_list[1]) < max_x) and \
-           (float(bbox_list[3]) > min_x and float(bbox_list[3]) < max_x), (''
-                                f'British Longitude values must be between '
-                                f'{min_x} and {max_x}. {msg}')
+    if len(bbox_list) < 4:
+        raise ValueError(f'Bbox must contain four coordinates. {msg}')
+    y1, x1, y2, x2 = map(float, bbox_list[:4])
+    if not (min_y < y1 < max_y and min_y < y2 < max_y):
+        raise ValueError('British Latitude values must be between '
+                         f'{min_y} and {max_y}. {msg}')
+    if not (min_x < x1 < max_x and min_x < x2 < max_x):
+        raise ValueError('British Longitude values must be between '
+                         f'{min_x} and {max_x}. {msg}')
+
+
+_BBOX_VALIDATORS = {
+    'EPSG:4326': partial(_validate_bbox, min_x=-7, max_x=2,
+                                         min_y=49, max_y=61,
+                         msg=('Format bbox as a comma-separated string of '
+                              'the form "latitude_SW, longitude_SW, '
+                              'latitude_NE, longitude_NE".')),
+    'EPSG:27700': partial(_validate_bbox, min_x=0, max_x=700000,
+                                          min_y=0, max_y=1250000,
+                          msg=('Format bbox as a comma-separated string of '
+                               'the form "Easting_SW, Northing_SW, '
+                               'Easting_NE, Northing_NE".'))}
 
 
 def validate_bbox(bbox_string, srs='EPSG:4326'):
     """N.B. Top Left and Bottom Right coordinates can be interchanged. 
     Whitespace is immaterial."""
     validate_srs(srs)
-    if srs == 'EPSG:4326':
-        _validate_bbox(bbox_string, srs='EPSG:4326', min_x=-7, max_x=2, 
-                                                     min_y=49, max_y=61)
-    elif srs == 'EPSG:27700':
-        _validate_bbox(bbox_string, srs='EPSG:27700', min_x=0, max_x=700000, 
-                                                      min_y=0, max_y=1250000)
+    _BBOX_VALIDATORS[srs](bbox_string)
 
 
 def validate_request_params(api_service, allow_premium, type_name, 
                             bbox, srs, output_format):
     validate_type_name(type_name, api_service, allow_premium)
     validate_srs(srs)
-    validate_bbox(bbox, srs)
+    _BBOX_VALIDATORS[srs](bbox)
     validate_output_format(output_format)
 
 def validate_api_key(api_key):
-    assert len(str(api_key)) == 32, 'OS Data Hub API Keys are 32 characters.'
+    if isinstance(api_key, (str, bytes)):
+        key_length = len(api_key)
+    else:
+        key_length = len(str(api_key))
+    if key_length != 32:
+        raise ValueError('OS Data Hub API Keys are 32 characters.')
 
 
 
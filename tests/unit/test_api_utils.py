@@ -21,12 +21,28 @@ def test_get_geometry_feature_type_success():
     assert feature_type == 'LineString'    
 
 
+def test_convert_features_to_geojson_success():
+    feature = {"type": "Feature",
+                "geometry": {
+                "type": "MultiLineString",
+                "coordinates": [
+                [[0.985674076026689,51.07949125302662],[0.9894006268513168,51.07891028754501]]
+                ]
+                },
+                "properties": {
+                "Type": "B Road"}}
+    converted = convert_features_to_geojson([feature, feature])
+    assert converted == [convert_single_feature_to_geojson(feature)] * 2
+    assert converted[0]['geometry']['type'] == 'LineString'
+    assert converted[0]['properties'] == {"Type": "B Road"}
+
+
 def test_validate_srs_success():
     validate_srs('EPSG:27700')
 
 
 def test_validate_srs_fail():
-    with pytest.raises(AssertionError) as e:
+    with pytest.raises(ValueError) as e:
         validate_srs('EPSG:1234')
     expected_error = 'EPSG:1234 is not a valid Spatial Reference System.'
     assert expected_error in e.value.args[0]
@@ -38,12 +54,19 @@ def test_validate_output_format_success():
 
 
 def test_validate_output_format_fail():
-    with pytest.raises(AssertionError) as e:
+    with pytest.raises(ValueError) as e:
         validate_output_format('shp')
     expected_error = 'shp is not a valid output format.'
     assert expected_error in e.value.args[0]
 
 
+def test_validate_output_format_fail_partial_match():
+    with pytest.raises(ValueError) as e:
+        validate_output_format('json')
+    expected_error = 'json is not a valid output format.'
+    assert expected_error in e.value.args[0]
+
+
 def test_validate_api_service_success():
     validate_api_service('wfs')
 
@@ -55,10 +78,24 @@ def test_validate_api_service_fail():
     assert e.value.args[0] == f'Please use {[api.name for api in API_Service]}'
 
 
+def test_validate_api_service_fail_enum_attribute():
+    for attribute in ('name', '__doc__'):
+        with pytest.raises(TypeError):
+            validate_api_service(attribute)
+
+
 def test_validate_type_name_success():
     assert validate_type_name('Zoomstack_RoadsRegional', 'wfs', False)
 
 
+def test_validate_type_name_premium():
+    assert validate_type_name('Highways_RoadLink', 'wfs', True)
+    with pytest.raises(ValueError) as e:
+        validate_type_name('Highways_RoadLink', 'wfs', False)
+    expected_error = '"Highways_RoadLink" is only available as a Premium Product.'
+    assert expected_error in e.value.args[0]
+
+
 def test_validate_type_name_fail():
     with pytest.raises(ValueError) as e:
         validate_type_name('water', 'wfs', False)
@@ -74,13 +111,25 @@ def test_validate_bbox_success():
     validate_bbox('51, -1, 52, 1', srs='EPSG:4326')
 
 
+def test_validate_bbox_with_srs_suffix_success():
+    validate_bbox('51,-1,52,1,EPSG:4326', srs='EPSG:4326')
+    validate_bbox('605621,139199,606621,140199,EPSG:27700', srs='EPSG:27700')
+
+
+def test_validate_bbox_fail_too_few_values():
+    for bbox in ('51', '51,-1', '51,-1,52'):
+        with pytest.raises(ValueError) as e:
+            validate_bbox(bbox, srs='EPSG:4326')
+        assert e.value.args[0].startswith('Bbox must contain four coordinates.')
+
+
 def test_validate_bbox_fail_bng():
-    with pytest.raises(AssertionError) as e:
+    with pytest.raises(ValueError) as e:
         validate_bbox('605621,3139199,606621,140199', srs='EPSG:27700')
     assert e.value.args[0] == 'British Longitude values must be between 0 and 700000. Format bbox as a comma-separated string of the form "Easting_SW, Northing_SW, Easting_NE, Northing_NE".'
 
 def test_validate_bbox_fail_wgs():
-    with pytest.raises(AssertionError) as e:
+    with pytest.raises(ValueError) as e:
         validate_bbox('30, -1, 52, 1', srs='EPSG:4326')
     assert e.value.args[0] == 'British Latitude values must be between 49 and 61. Format bbox as a comma-separated string of the form "latitude_SW, longitude_SW, latitude_NE, longitude_NE".'
 
@@ -104,8 +153,12 @@ def test_validate_api_key_success():
     validate_api_key('abcdefghijklmnopqrstuvwxyzabcdef')
 
 
+def test_validate_api_key_bytes_success():
+    validate_api_key(b'abcdefghijklmnopqrstuvwxyzabcdef')
+
+
 def test_validate_api_key_fail():
-    with pytest.raises(AssertionError) as e:
+    with pytest.raises(ValueError) as e:
         validate_api_key('abc')
     assert e.value.args[0] == 'OS Data Hub API Keys are 32 characters.'
 